@@ -4,13 +4,112 @@ Core module: data models and business logic.
 Contains:
 - Field, Name, Phone, Birthday — fields with validation
 - Record — contact
-- AddressBook — contact book (inherits UserDict)
+- AddressBook — contact book (inherits dict)
+
+pickle and tempfile are imported inside save_data/load_data, which run
+at most once each per session, to keep them out of interpreter startup.
 """
 
-import pickle
-from datetime import datetime, timedelta
-from collections import UserDict
-from typing import Optional, List
+import os
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from typing import Optional, Dict, Iterator, List, Tuple
+
+def _parse_date(value: str) -> date:
+    """
+    Parses a DD.MM.YYYY string into a date without going through strptime.
+
+    Like the strptime format used before, the day and month may be given
+    without a leading zero (e.g. 1.1.2000).
+
+    Args:
+        value (str): Date string.
+
+    Returns:
+        date: Parsed date.
+
+    Raises:
+        ValueError: If the string is not in DD.MM.YYYY format or the date does not exist.
+    """
+    parts = value.split('.')
+    if len(parts) != 3:
+        raise ValueError('Invalid date format. Use DD.MM.YYYY')
+    day, month, year = parts
+    if not (0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4):
+        raise ValueError('Invalid date format. Use DD.MM.YYYY')
+    digits = day + month + year
+    if not digits.isascii() or not digits.isdigit():
+        raise ValueError('Invalid date format. Use DD.MM.YYYY')
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        raise ValueError('Invalid date format. Use DD.MM.YYYY')
+
+def _anniversary(birthday: date, year: int) -> date:
+    """
+    Returns the birthday moved to the given year.
+
+    Args:
+        birthday (date): Date of birth.
+        year (int): Target year.
+
+    Returns:
+        date: Anniversary date; 1 March for 29 February in non-leap years.
+    """
+    try:
+        return birthday.replace(year=year)
+    except ValueError:
+        return date(year, 3, 1)
+
+def _slot_state(state) -> dict:
+    """
+    Normalizes pickled object state to a plain attribute dict.
+
+    Slotted objects pickle as a (dict, slots) pair, while objects pickled
+    before __slots__ were introduced carry their old __dict__.
+
+    Args:
+        state: Pickled state.
+
+    Returns:
+        dict: Attribute names mapped to values.
+    """
+    if isinstance(state, tuple):
+        attrs, slots = state
+        return {**(attrs or {}), **(slots or {})}
+    return state
+
+def _file_mode(filename: str) -> int:
+    """
+    Returns the permission bits a saved file should get.
+
+    Args:
+        filename (str): Path of the file being written.
+
+    Returns:
+        int: Mode of the existing file, or the umask default for a new one.
+    """
+    try:
+        return os.stat(filename).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def _restore(cls: type, value: str) -> "Field":
+    """
+    Recreates an already validated field without running its validation.
+
+    Args:
+        cls (type): Field class (Phone, Birthday, ...).
+        value (str): Stored field value.
+
+    Returns:
+        Field: Field instance with the given value.
+    """
+    field = cls.__new__(cls)
+    field.value = value
+    return field
 
 class Field:
     """
@@ -20,6 +119,8 @@ class Field:
         value (str): Stored field value.
     """
 
+    __slots__ = ('value',)
+
     def __init__(self, value: str) -> None:
         """
         Initializes the field with the specified value.
@@ -32,6 +133,11 @@ class Field:
     def __str__(self) -> None:
         """Returns a string representation of the value."""
         return str(self.value)
+
+    def __setstate__(self, state) -> None:
+        """Restores a pickled field, including ones pickled before __slots__."""
+        for key, value in _slot_state(state).items():
+            setattr(self, key, value)
     
 class Name(Field):
     """
@@ -40,6 +146,8 @@ class Name(Field):
     Inherited from Field.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Initializes the contact name.
@@ -53,9 +161,11 @@ class Phone(Field):
     """
     Class for storing phone numbers with validation.
 
-    The number must contain exactly 10 digits.
+    The number must contain exactly 10 ASCII digits.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Initializes a phone number with format validation.
@@ -64,35 +174,41 @@ class Phone(Field):
             value (str): Phone number.
 
         Raises:
-            ValueError: If the length is not 10 or contains non-numeric characters.
+            ValueError: If the value is not exactly 10 ASCII digits.
         """
-        if len(value) != 10:
-            raise ValueError("The length of the telephone number must be 10 numbers.")
-        if not value.isdigit():
-            raise ValueError("Value must consist of numbers.")
+        if len(value) != 10 or not value.isascii() or not value.isdigit():
+            raise ValueError("Phone must be exactly 10 ASCII digits.")
         super().__init__(value)
 
 class Birthday(Field):
     """Birthday. Format: DD.MM.YYYY."""
+
+    __slots__ = ('_date',)
+
     def __init__(self, value):
-        try:
-            datetime.strptime(value, "%d.%m.%Y")
-        except ValueError:
-            raise ValueError('Invalid date format. Use DD.MM.YYYY')
+        self._date = _parse_date(value)
         super().__init__(value)
 
+    def __setstate__(self, state) -> None:
+        """Restores a pickled birthday, parsing the date if the pickle predates the cache."""
+        super().__setstate__(state)
+        if not hasattr(self, '_date'):
+            self._date = _parse_date(self.value)
+
     @property
-    def date(self) -> datetime:
-        """Returns a date object for comparison and calculation."""
-        return datetime.strptime(self.value, "%d.%m.%Y").date()
+    def date(self) -> date:
+        """Returns a date object for comparison and calculation (parsed once on creation)."""
+        return self._date
     
 class Record:
     """
     Class for storing contact information.
 
-    Contains name and list of phone numbers.
+    Contains name, phone numbers indexed by value and an optional birthday.
     """
 
+    __slots__ = ('name', '_phones', 'birthday', '_book', '_str_cache')
+
     def __init__(self, name: str) -> None:
         """
         Initializes a contact with a name.
@@ -101,8 +217,35 @@ class Record:
             name (str): Contact name.
         """
         self.name = Name(name)
-        self.phones: List[Phone] = []
+        self._phones: Dict[str, Phone] = {}
         self.birthday = None
+        self._book: Optional["AddressBook"] = None
+        self._str_cache: Optional[str] = None
+
+    @property
+    def phones(self) -> List[Phone]:
+        """Returns the contact's phone numbers in the order they were added."""
+        return list(self._phones.values())
+
+    def _changed(self) -> None:
+        """Drops the cached rendering and notifies the owning address book of a change."""
+        self._str_cache = None
+        if self._book is not None:
+            self._book._touch()
+
+    def __getstate__(self) -> dict:
+        """Returns the pickle state without the back-reference to the book."""
+        return {'name': self.name, '_phones': self._phones, 'birthday': self.birthday}
+
+    def __setstate__(self, state) -> None:
+        """Restores a pickled record, migrating the old list of phones to the index."""
+        self._book = None
+        self._str_cache = None
+        state = dict(_slot_state(state))
+        if 'phones' in state:
+            state['_phones'] = {p.value: p for p in state.pop('phones')}
+        for key, value in state.items():
+            setattr(self, key, value)
 
     def add_phone(self, phone: str) -> None:
         """
@@ -114,11 +257,17 @@ class Record:
         Raises:
             ValueError: If the number does not pass validation.
         """
-        self.phones.append(Phone(phone))
+        new = Phone(phone)
+        self._phones[new.value] = new
+        self._changed()
     
     def add_birthday(self, args: str):
         """Sets the birthday."""
+        old = self.birthday
         self.birthday = Birthday(args)
+        if self._book is not None:
+            self._book._index_birthday(self.name.value, old, self.birthday)
+        self._changed()
 
     def remove_phone(self, phone: str) -> None:
         """
@@ -127,8 +276,8 @@ class Record:
         Args:
             phone (str): Phone number to remove.
         """
-        find = self.find_phone(phone)
-        self.phones.remove(find)
+        if self._phones.pop(phone, None) is not None:
+            self._changed()
 
     def edit_phone(self, old_phone: str, new_phone: str) -> None:
         """
@@ -141,15 +290,13 @@ class Record:
         Raises:
             ValueError: If the old number is not found or the new one is invalid.
         """
-        old_phone_obj = self.find_phone(old_phone)
-
-        if not old_phone_obj:
+        if old_phone not in self._phones:
             raise ValueError("Old number not found.")
-        
-        Phone(new_phone)
 
-        self.remove_phone(old_phone)
-        self.phones.append(Phone(new_phone))
+        new = Phone(new_phone)
+        del self._phones[old_phone]
+        self._phones[new.value] = new
+        self._changed()
         
     def find_phone(self, phone: str) -> Optional[Phone]:
         """
@@ -164,27 +311,129 @@ class Record:
         Raises:
             ValueError: If the number does not match the format (10 digits).
         """
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return self._phones.get(phone)
         
     def __str__(self) -> str:
-        """Returns a human-readable representation of the contact."""
-        phones = "; ".join(p.value for p in self.phones)
-        birthday = f", birthday: {self.birthday}" if self.birthday else ""
-        return f"Contact name: {self.name.value}, phones: {phones}{birthday}"
+        """Returns a human-readable representation of the contact (cached until it changes)."""
+        if self._str_cache is None:
+            phones = "; ".join(self._phones)
+            birthday = f", birthday: {self.birthday}" if self.birthday else ""
+            self._str_cache = f"Contact name: {self.name.value}, phones: {phones}{birthday}"
+        return self._str_cache
     
     def __repr__(self) -> str:
         return f"Record(name={self.name.value}, phones={self.phones}, birthday=_{self.birthday})"
     
-class AddressBook(UserDict):
+class AddressBook(dict):
     """
     Class for storing and managing contact records.
 
-    Inherited from UserDict. Keys are names (str), values are Record objects.
+    Inherited from dict. Keys are names (str), values are Record objects.
+    Every way of adding or removing a contact (add_record/delete as well as
+    item assignment, del, pop, update, ...) goes through __setitem__ or
+    _detach, which keep the birthday index, the record back-references and
+    the change tracking in sync. Records report their own changes back to
+    the book. Birthdays are kept in a (month, day, name) index sorted by date.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initializes an empty book (or one filled from the given mapping)."""
+        self._upcoming: Optional[Tuple[date, list]] = None
+        self._dirty = False
+        self._by_mmdd: List[Tuple[int, int, str]] = []
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def _touch(self) -> None:
+        """Marks the book as modified and invalidates results cached from its contents."""
+        self._upcoming = None
+        self._dirty = True
+
+    def _index_birthday(self, name: str, old: Optional[Birthday], new: Optional[Birthday]) -> None:
+        """
+        Moves a contact's entry in the sorted birthday index.
+
+        Args:
+            name (str): Contact name.
+            old (Optional[Birthday]): Birthday to remove from the index.
+            new (Optional[Birthday]): Birthday to add to the index.
+        """
+        if old is not None:
+            key = (old.date.month, old.date.day, name)
+            i = bisect_left(self._by_mmdd, key)
+            if i < len(self._by_mmdd) and self._by_mmdd[i] == key:
+                del self._by_mmdd[i]
+        if new is not None:
+            insort(self._by_mmdd, (new.date.month, new.date.day, name))
+
+    def _detach(self, name: str, record: Record) -> None:
+        """Releases a record that has already been removed from the dict."""
+        record._book = None
+        self._index_birthday(name, record.birthday, None)
+        self._touch()
+
+    def __setitem__(self, name: str, record: Record) -> None:
+        """
+        Stores a record under the given name, replacing any previous one.
+
+        Raises:
+            ValueError: If the name is not the record's own name, or the
+                record already belongs to another address book.
+        """
+        if name != record.name.value:
+            raise ValueError(f"Record '{record.name.value}' cannot be stored under '{name}'.")
+        if record._book is not None and record._book is not self:
+            raise ValueError(f"Record '{name}' already belongs to another address book.")
+        replaced = self.get(name)
+        if replaced is not None:
+            dict.__delitem__(self, name)
+            self._detach(name, replaced)
+        record._book = self
+        dict.__setitem__(self, name, record)
+        self._index_birthday(name, None, record.birthday)
+        self._touch()
+
+    def __delitem__(self, name: str) -> None:
+        """Removes the record stored under the given name."""
+        self._detach(name, dict.pop(self, name))
+
+    def pop(self, name: str, *default):
+        """Removes and returns the record stored under the given name."""
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        record = dict.pop(self, name)
+        self._detach(name, record)
+        return record
+
+    def popitem(self) -> Tuple[str, Record]:
+        """Removes and returns the most recently added (name, record) pair."""
+        name, record = dict.popitem(self)
+        self._detach(name, record)
+        return name, record
+
+    def setdefault(self, name: str, record: Record) -> Record:
+        """Returns the record stored under the name, storing the given one if absent."""
+        if name not in self:
+            self[name] = record
+        return self[name]
+
+    def update(self, *args, **kwargs) -> None:
+        """Adds every (name, record) pair from a mapping or iterable through __setitem__."""
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def __ior__(self, other) -> "AddressBook":
+        """Implements book |= mapping through update."""
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        """Removes all records."""
+        while self:
+            self.popitem()
+
     def add_record(self, record: Record) -> None:
         """
         Adds an entry to the address book.
@@ -192,7 +441,7 @@ class AddressBook(UserDict):
         Args:
             record (Record): Contact object.
         """
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name: str) -> Optional[Record]:
         """
@@ -204,7 +453,7 @@ class AddressBook(UserDict):
         Returns:
             Optional[Record]: Record object or None if not found.
         """
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str) -> None:
         """
@@ -213,44 +462,83 @@ class AddressBook(UserDict):
         Args:
             name (str): Contact name.
         """
-        if name in self.data:
-            del self.data[name]
+        self.pop(name, None)
     
     def get_upcoming_birthdays(self):
         """
-        Returns a list of contacts whose birthdays are within the next `days` days.
+        Returns a list of contacts whose birthdays are within the next 7 days.
         
         Takes into account the transfer to Monday if the birthday falls on a weekend.
+        A 29 February birthday is celebrated on 1 March in non-leap years.
+        The result is cached for the current day until the book changes.
+        Only contacts found in the 7-day window of the birthday index are checked.
         """
-        today = datetime.today().date()
-        upcoming = []
-
-        for record in self.data.values():
-            if not record.birthday:
+        today = date.today()
+        if self._upcoming is not None and self._upcoming[0] == today:
+            return list(self._upcoming[1])
+        year = today.year
+        last_day = today + timedelta(days=7)
+        found = []
+
+        # 29 February birthdays are celebrated on 1 March in non-leap years
+        start = (2, 29) if (today.month, today.day) == (3, 1) else (today.month, today.day)
+        lo = bisect_left(self._by_mmdd, start)
+        hi = bisect_left(self._by_mmdd, (last_day.month, last_day.day + 1))
+        if last_day.year == year:
+            candidates = self._by_mmdd[lo:hi]
+        else:
+            candidates = self._by_mmdd[lo:] + self._by_mmdd[:hi]
+
+        for _, _, name in candidates:
+            record = self.get(name)
+            if record is None or not record.birthday:
                 continue
-            birthday = record.birthday.date.replace(year=today.year)
+            birthday = _anniversary(record.birthday.date, year)
             if birthday < today:
-                birthday = birthday.replace(year=today.year + 1)               
-            if today <= birthday <= today + timedelta(days=7):    
-                if birthday.weekday() >= 5:
-                    days_to_monday = 7 - birthday.weekday()
-                    cong_day = birthday + timedelta(days=days_to_monday)
-                else:
-                    cong_day = birthday
-                upcoming.append({
-                    "name": record.name.value, 
-                    "birthday": cong_day.strftime("%d.%m.%Y")
-                    })
-        return upcoming
+                birthday = _anniversary(record.birthday.date, year + 1)
+            if birthday <= last_day:
+                weekday = birthday.weekday()
+                if weekday >= 5:
+                    birthday += timedelta(days=7 - weekday)
+                found.append((record.name.value, birthday))
+
+        upcoming = [
+            {"name": name, "birthday": f"{cong_day.day:02}.{cong_day.month:02}.{cong_day.year}"}
+            for name, cong_day in found
+        ]
+        self._upcoming = (today, upcoming)
+        return list(upcoming)
     
     def save_data(self, filename: str ='addressbook.pkl') -> None:
         """
         Saves the current address book to a file using pickle.
         
         Used when exiting the programme correctly (close/exit).
+        Does nothing if the book has not changed since it was loaded or last saved.
+        The stream uses the highest pickle protocol and is written in one call.
+        The data goes to a temporary file that atomically replaces the
+        target, so an interrupted save never corrupts the existing book.
+        The saved file keeps the permissions of the file it replaces.
         """
-        with open(filename, 'wb') as file:
-            pickle.dump(self, file)
+        if not self._dirty:
+            return
+        import pickle
+        import tempfile
+
+        payload = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        directory = os.path.dirname(filename) or '.'
+        file = tempfile.NamedTemporaryFile('wb', dir=directory, delete=False)
+        try:
+            with file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(file.name, _file_mode(filename))
+            os.replace(file.name, filename)
+        except BaseException:
+            os.unlink(file.name)
+            raise
+        self._dirty = False
 
     @classmethod
     def load_data(csl, filename: str ='addressbook.pkl') -> "AddressBook":
@@ -261,13 +549,66 @@ class AddressBook(UserDict):
         """
         try:
             with open(filename, 'rb') as file:
-                return pickle.load(file)
+                payload = file.read()
         except FileNotFoundError:
             return csl()
+        import pickle
+
+        return pickle.loads(payload)
+
+    def __getstate__(self) -> List[Tuple[str, List[str], Optional[str]]]:
+        """
+        Flattens the book into built-in types for pickling.
+
+        Returns:
+            List[Tuple[str, List[str], Optional[str]]]: (name, phones, birthday) per contact.
+        """
+        return [
+            (name, list(record._phones), record.birthday.value if record.birthday else None)
+            for name, record in self.items()
+        ]
+
+    def __setstate__(self, state) -> None:
+        """
+        Rebuilds the book from the flattened pickle state.
+
+        Phones were validated when they were first added, so they are
+        restored directly; birthdays are re-created to parse their date.
+        Books pickled by the old UserDict-based class ({'data': ...} state)
+        are still accepted.
+        """
+        self._upcoming = None
+        self._dirty = False
+        self._by_mmdd = []
+        # Filled with the plain dict methods; the index is rebuilt in bulk below
+        dict.clear(self)
+        if isinstance(state, dict):
+            dict.update(self, state.get('data', {}))
+        else:
+            for name, phones, birthday in state:
+                record = Record(name)
+                record._phones = {phone: _restore(Phone, phone) for phone in phones}
+                if birthday is not None:
+                    record.birthday = Birthday(birthday)
+                dict.__setitem__(self, name, record)
+        for name, record in self.items():
+            record._book = self
+            if record.birthday:
+                self._by_mmdd.append((record.birthday.date.month, record.birthday.date.day, name))
+        self._by_mmdd.sort()
+
+    def __reduce_ex__(self, protocol: int):
+        """Pickles the book only through its flattened state, not its dict items."""
+        return (type(self), (), self.__getstate__())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yields the string representation of each contact, one at a time."""
+        for record in self.values():
+            yield str(record)
 
     def __str__(self) -> str:
         """Returns a string representation of the entire book."""
-        return "\n".join(str(record) for record in self.data.values())
+        return "\n".join(self.iter_lines())
     
     def __repr__(self) -> str:
         """
@@ -275,4 +616,4 @@ class AddressBook(UserDict):
         
         Useful for debugging and logging.
         """
-        return f"AddressBook({self.data})"
\ No newline at end of file
+        return f"AddressBook({dict.__repr__(self)})"
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Module for parsing user commands."""
+import sys
 from typing import Tuple, List
 
 def parse_input(user_input: str) -> Tuple[str, List[str]]:
@@ -9,7 +10,8 @@ def parse_input(user_input: str) -> Tuple[str, List[str]]:
         user_input (str): String entered by the user.
 
     Returns:
-        Tuple[str, List[str]]: (command in lowercase, list of arguments)
+        Tuple[str, List[str]]: (command in lowercase, list of arguments);
+        ('', []) for blank input.
 
     Examples:
         >>> parse_input("add John 123")
@@ -17,9 +19,9 @@ def parse_input(user_input: str) -> Tuple[str, List[str]]:
         >>> parse_input("Hello")
         ('hello', [])
     """
-    parts = user_input.strip().split()
+    parts = user_input.split()
     if not parts:
-        return ()
-    cmd = parts[0].lower()
+        return '', []
+    cmd = sys.intern(parts[0].lower())
     args = parts[1:]
     return cmd, args
\ No newline at end of file
@@ -1,7 +1,11 @@
 """Module with command handlers for the assistant bot."""
+import sys
 from .book_tools import Record, AddressBook
 from .utils import input_error
 
+# Books larger than this are written to stdout line by line by the 'all' command
+STREAM_THRESHOLD = 1000
+
 @input_error
 def hello(args: list, address_book: AddressBook) -> str: 
     """Handles the 'hello' command — greets the user."""
@@ -10,17 +14,17 @@ def hello(args: list, address_book: AddressBook) -> str:
 @input_error
 def add_contact(args: list, address_book: AddressBook) -> str:
         """Handles the 'add' command — adds a new contact or phone to an existing one."""
-        name = args[0]
-        phone = args[1]
+        if len(args) < 2:
+            return 'Not enough arguments.'
+        name, phone, *_ = args
         record = address_book.find(name)
         if record is None:
             record = Record(name)
+            record.add_phone(phone)
             address_book.add_record(record)
-            message = 'Contact added.'
-        else:
-            message = 'Contact update.'
+            return 'Contact added.'
         record.add_phone(phone)
-        return message
+        return 'Contact update.'
 
 @input_error
 def change(args: list, address_book: AddressBook) -> str:
@@ -29,30 +33,44 @@ def change(args: list, address_book: AddressBook) -> str:
         return 'Enter name, old phone and new phone.'
     name, old_phone, new_phone, *_ = args
     record = address_book.find(name)
+    if record is None:
+        return 'Operation failed. Contact may not exist.'
     record.edit_phone(old_phone, new_phone)
     return 'Contact updated.'
 
 @input_error
 def phone(args: list, address_book: AddressBook) -> str:
     """Handles the 'phone' command — shows the phone number by name."""
+    if not args:
+        return 'Not enough arguments.'
     name = args[0]
     record = address_book.find(name)
+    if record is None:
+        return 'Operation failed. Contact may not exist.'
     phones = "; ".join(p.value for p in record.phones)
     return f"{name}: {phones}"
 
 @input_error
 def add_bday(args: list, address_book: AddressBook):
     """Handles the 'phone' command — adds a new birthday to contact."""
+    if len(args) < 2:
+        return 'Not enough arguments.'
     name, birthday, *_ = args
     record = address_book.find(name)
+    if record is None:
+        return 'Operation failed. Contact may not exist.'
     record.add_birthday(birthday)
     return 'Birthday added.'
 
 @input_error
 def show_bday(args: list, address_book: AddressBook):
     """Handles the 'phone' command — shows the birthday by name."""
+    if not args:
+        return 'Not enough arguments.'
     name = args[0]
     record = address_book.find(name)
+    if record is None:
+        return 'Operation failed. Contact may not exist.'
     if not record.birthday:
         return f"{name} has no birthday saved."
     return f"{name}'s birthday: {record.birthday}"
@@ -71,9 +89,12 @@ def bdays(args: list, address_book: AddressBook):
 @input_error
 def all(args: list, address_book: AddressBook) -> str:
     """Handles the 'all' command — displays all saved contacts."""
-    if not address_book.data:
+    if not address_book:
         return 'No contacts saved.'
-    return "\n".join(str(record) for record in address_book.data.values())
+    if len(address_book) > STREAM_THRESHOLD:
+        sys.stdout.writelines(f"{line}\n" for line in address_book.iter_lines())
+        return f"{len(address_book)} contacts shown."
+    return str(address_book)
 
 @input_error
 def goodbye(args: list, address_book: AddressBook) -> str:
@@ -92,4 +113,7 @@ COMMANDS = {
     'all': all,
     'close': goodbye,
     'exit': goodbye
-}
\ No newline at end of file
+}
+# Intern keys so lookups with names interned by parse_input compare by identity;
+# the compiler only interns identifier-like literals, not e.g. 'add-birthday'
+COMMANDS = {sys.intern(name): handler for name, handler in COMMANDS.items()}
\ No newline at end of file
@@ -10,22 +10,26 @@ def input_error(func: callable) -> Callable:
     """
     Decorator for handling errors in commands.
 
+    Handlers validate their arguments themselves; this is the safety net
+    for lookup errors and invalid phone or date values (ValueError).
+    The wrapper takes the handler's exact (args, address_book) signature.
+
     Args:
-        func (Callable): Command handler.
+        func (Callable): Command handler taking (args, address_book).
 
     Returns:
         Callable: Wrapped function.
     """
     @wraps(func)
-    def inner(*args, **kwargs):
+    def inner(args, address_book):
         try:
-            return func(*args, **kwargs)
-        except (IndexError, IndexError):
+            return func(args, address_book)
+        except IndexError:
             return "Not enough arguments."
         except KeyError:
             return "Contact not found."
         except AttributeError:
             return "Operation failed. Contact may not exist."
-        except Exception as err:
+        except ValueError as err:
             return f"Error: {err}"
     return inner
\ No newline at end of file
@@ -20,30 +20,30 @@ def main() -> None:
     The main function of the bot.
     
     Loads the address book at startup,
-    saves it when exiting,
+    saves it when exiting (also on Ctrl-C or an unexpected error),
     manages the entire user interaction cycle.
     """
     address_book = AddressBook.load_data()
     print("Welcome to the assistant bot!")
-    while True:
-        
-        user_input = input("Enter a command: ").strip()
-        if not user_input:
-            print('Enter a command please.')
-            continue
-
-        command, args = parse_input(user_input)
-
-        if command not in COMMANDS:
-            print('Invalid command.')
-            continue
-        
-        result = COMMANDS[command](args, address_book)
-        print(result)
-
-        if command in ["close", "exit"]:
-            address_book.save_data()
-            break
+    try:
+        while True:
+
+            command, args = parse_input(input("Enter a command: "))
+            if not command:
+                print('Enter a command please.')
+                continue
+
+            handler = COMMANDS.get(command)
+            if handler is None:
+                print('Invalid command.')
+                continue
+
+            print(handler(args, address_book))
+
+            if command in ["close", "exit"]:
+                break
+    finally:
+        address_book.save_data()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""Tests for the AddressBook bookkeeping (birthday index, change tracking)."""
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+from address_book import AddressBook, Record
+from address_book import book_tools
+
+
+def frozen_today(today: date):
+    """Patches date.today() as seen by book_tools."""
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+    return mock.patch.object(book_tools, 'date', FrozenDate)
+
+
+def make_record(name: str, birthday: str = None) -> Record:
+    record = Record(name)
+    if birthday is not None:
+        record.add_birthday(birthday)
+    return record
+
+
+class DictMutationTest(unittest.TestCase):
+    """Native dict operations must keep the book's invariants."""
+
+    def setUp(self) -> None:
+        self.book = AddressBook()
+        self.book.add_record(make_record('John', '27.02.1990'))
+        self.book._dirty = False
+
+    def assert_index(self, expected) -> None:
+        self.assertEqual(self.book._by_mmdd, expected)
+
+    def test_setitem_marks_dirty_and_indexes(self) -> None:
+        record = make_record('X', '01.03.1990')
+        self.book['X'] = record
+        self.assertTrue(self.book._dirty)
+        self.assertIs(record._book, self.book)
+        self.assert_index([(2, 27, 'John'), (3, 1, 'X')])
+
+    def test_setitem_rejects_mismatched_key(self) -> None:
+        record = make_record('Jane')
+        with self.assertRaises(ValueError):
+            self.book['X'] = record
+        with self.assertRaises(ValueError):
+            self.book.update({'X': record})
+        self.assertNotIn('X', self.book)
+        self.assertIsNone(record._book)
+        self.assertFalse(self.book._dirty)
+        record.add_birthday('01.03.1990')
+        self.assert_index([(2, 27, 'John')])
+
+    def test_record_from_another_book_rejected(self) -> None:
+        record = self.book['John']
+        other = AddressBook()
+        with self.assertRaises(ValueError):
+            other.add_record(record)
+        self.assertNotIn('John', other)
+        self.assertIs(record._book, self.book)
+        record.add_phone('1234567890')
+        self.assertTrue(self.book._dirty)
+        self.book.delete('John')
+        other.add_record(record)
+        self.assertIs(record._book, other)
+
+    def test_readding_same_record(self) -> None:
+        record = self.book['John']
+        self.book.add_record(record)
+        self.assertIs(record._book, self.book)
+        self.assert_index([(2, 27, 'John')])
+
+    def test_setitem_replaces_existing(self) -> None:
+        old = self.book['John']
+        self.book['John'] = make_record('John', '05.05.1990')
+        self.assertIsNone(old._book)
+        self.assert_index([(5, 5, 'John')])
+
+    def test_delitem(self) -> None:
+        record = self.book['John']
+        del self.book['John']
+        self.assertTrue(self.book._dirty)
+        self.assertIsNone(record._book)
+        self.assert_index([])
+
+    def test_pop_popitem_clear(self) -> None:
+        self.assertIsNone(self.book.pop('Nobody', None))
+        with self.assertRaises(KeyError):
+            self.book.pop('Nobody')
+        self.book.pop('John')
+        self.assert_index([])
+        self.book.update({'A': make_record('A', '01.01.1990')}, B=make_record('B', '02.01.1990'))
+        self.assert_index([(1, 1, 'A'), (1, 2, 'B')])
+        self.book.popitem()
+        self.assert_index([(1, 1, 'A')])
+        self.book.clear()
+        self.assert_index([])
+        self.assertEqual(len(self.book), 0)
+
+    def test_setdefault_and_ior(self) -> None:
+        self.book.setdefault('A', make_record('A', '01.01.1990'))
+        self.book |= {'B': make_record('B', '02.01.1990')}
+        self.assert_index([(1, 1, 'A'), (1, 2, 'B'), (2, 27, 'John')])
+
+    def test_constructor_mapping(self) -> None:
+        book = AddressBook({'A': make_record('A', '01.01.1990')})
+        self.assertEqual(book._by_mmdd, [(1, 1, 'A')])
+        self.assertIs(book['A']._book, book)
+
+    def test_birthdays_after_del(self) -> None:
+        with frozen_today(date(2027, 2, 25)):
+            self.assertEqual(len(self.book.get_upcoming_birthdays()), 1)
+            del self.book['John']
+            self.assertEqual(self.book.get_upcoming_birthdays(), [])
+
+    def test_save_after_setitem(self) -> None:
+        self.book['X'] = make_record('X')
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'book.pkl')
+            self.book.save_data(filename)
+            self.assertFalse(self.book._dirty)
+            self.assertEqual(sorted(AddressBook.load_data(filename)), ['John', 'X'])
+
+
+def expected_upcoming(book: AddressBook, today: date) -> list:
+    """Reference implementation: scans every contact without the index."""
+    found = []
+    for name, record in book.items():
+        if not record.birthday:
+            continue
+        born = record.birthday.date
+        for year in (today.year, today.year + 1):
+            try:
+                birthday = born.replace(year=year)
+            except ValueError:
+                birthday = date(year, 3, 1)
+            if birthday >= today:
+                break
+        if birthday > today + timedelta(days=7):
+            continue
+        cong_day = birthday
+        if cong_day.weekday() >= 5:
+            cong_day += timedelta(days=7 - cong_day.weekday())
+        # Same-day ties follow the index: birth (month, day), then name
+        found.append((birthday, born.month, born.day, name, cong_day.strftime("%d.%m.%Y")))
+    found.sort()
+    return [{"name": name, "birthday": cong_day} for *_, name, cong_day in found]
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    """The bisect window must match a full scan on every day, in date order."""
+
+    def test_matches_full_scan(self) -> None:
+        book = AddressBook()
+        born = date(2000, 1, 1)
+        # One contact per day of a leap year, plus extra 29 February / year-end ones
+        for offset in range(366):
+            day = born + timedelta(days=offset)
+            book.add_record(make_record(f'c{offset:03}', day.strftime('%d.%m.%Y')))
+        for name, birthday in [('leap', '29.02.1996'), ('eve', '31.12.1980'), ('ny', '1.1.1985')]:
+            book.add_record(make_record(name, birthday))
+        book.add_record(make_record('nobirthday'))
+
+        day = date(2023, 1, 1)
+        while day <= date(2025, 12, 31):
+            with frozen_today(day):
+                self.assertEqual(book.get_upcoming_birthdays(), expected_upcoming(book, day), day)
+            day += timedelta(days=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Tests for saving and loading the address book."""
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from address_book import AddressBook, Record
+from address_book.book_tools import Birthday, Phone
+
+# AddressBook pickled by the original UserDict-based classes (protocol 4):
+# John — 1234567890, 0987654321, birthday 1.1.2000 (unpadded)
+# Jane — 1111111111, birthday 29.02.2000
+# Bob  — no phones, no birthday
+BASELINE_PICKLE = bytes.fromhex(
+    "8004956e010000000000008c17616464726573735f626f6f6b2e626f6f6b5f746f6f6c73"
+    "948c0b41646472657373426f6f6b9493942981947d948c0464617461947d94288c044a6f"
+    "686e9468008c065265636f72649493942981947d94288c046e616d659468008c044e616d"
+    "659493942981947d948c0576616c756594680773628c0670686f6e6573945d942868008c"
+    "0550686f6e659493942981947d9468118c0a313233343536373839309473626815298194"
+    "7d9468118c0a30393837363534333231947362658c0862697274686461799468008c0842"
+    "697274686461799493942981947d9468118c08312e312e3230303094736275628c044a61"
+    "6e659468092981947d9428680c680e2981947d9468116822736268125d9468152981947d"
+    "9468118c0a3131313131313131313194736261681c681e2981947d9468118c0a32392e30"
+    "322e3230303094736275628c03426f629468092981947d9428680c680e2981947d946811"
+    "682e736268125d94681c4e75627573622e"
+)
+
+# Record pickled on its own by the original classes (__dict__ state, list of phones):
+# John — 1234567890, 0987654321, birthday 1.1.2000
+BASELINE_RECORD = bytes.fromhex(
+    "800495cb000000000000008c17616464726573735f626f6f6b2e626f6f6b5f746f6f6c73"
+    "948c065265636f72649493942981947d94288c046e616d659468008c044e616d65949394"
+    "2981947d948c0576616c7565948c044a6f686e9473628c0670686f6e6573945d94286800"
+    "8c0550686f6e659493942981947d94680a8c0a31323334353637383930947362680f2981"
+    "947d94680a8c0a30393837363534333231947362658c0862697274686461799468008c08"
+    "42697274686461799493942981947d94680a8c08312e312e3230303094736275622e"
+)
+
+# Birthday('29.02.2000') pickled by the original classes (no cached date)
+BASELINE_BIRTHDAY = bytes.fromhex(
+    "80049544000000000000008c17616464726573735f626f6f6b2e626f6f6b5f746f6f6c73"
+    "948c0842697274686461799493942981947d948c0576616c7565948c0a32392e30322e32"
+    "3030309473622e"
+)
+
+
+class LoadBaselineTest(unittest.TestCase):
+    """Books written by the original code must keep loading."""
+
+    def setUp(self) -> None:
+        fd, self.filename = tempfile.mkstemp(suffix='.pkl')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(BASELINE_PICKLE)
+
+    def tearDown(self) -> None:
+        os.unlink(self.filename)
+
+    def test_load_baseline_pickle(self) -> None:
+        book = AddressBook.load_data(self.filename)
+        self.assertEqual(sorted(book), ['Bob', 'Jane', 'John'])
+        john = book.find('John')
+        self.assertEqual([p.value for p in john.phones], ['1234567890', '0987654321'])
+        self.assertEqual(john.birthday.value, '1.1.2000')
+        self.assertEqual(john.birthday.date, date(2000, 1, 1))
+        self.assertEqual(book.find('Jane').birthday.date, date(2000, 2, 29))
+        self.assertIsNone(book.find('Bob').birthday)
+
+    def test_baseline_book_survives_resave(self) -> None:
+        book = AddressBook.load_data(self.filename)
+        book.find('Bob').add_phone('2222222222')
+        book.save_data(self.filename)
+        book = AddressBook.load_data(self.filename)
+        self.assertEqual(book.find('John').birthday.date, date(2000, 1, 1))
+        self.assertEqual([p.value for p in book.find('Bob').phones], ['2222222222'])
+
+
+class PickleStateTest(unittest.TestCase):
+    """Every accepted pickle state shape must restore a working object."""
+
+    def assert_john(self, record: Record) -> None:
+        self.assertEqual(str(record), 'Contact name: John, phones: 1234567890; 0987654321, birthday: 1.1.2000')
+        self.assertEqual(record.find_phone('0987654321').value, '0987654321')
+        self.assertEqual(record.birthday.date, date(2000, 1, 1))
+        self.assertIsNone(record._book)
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_baseline_record_dict_state(self) -> None:
+        record = pickle.loads(BASELINE_RECORD)
+        self.assert_john(record)
+        record.edit_phone('1234567890', '1111111111')
+        self.assertEqual([p.value for p in record.phones], ['0987654321', '1111111111'])
+
+    def test_baseline_birthday_without_cached_date(self) -> None:
+        birthday = pickle.loads(BASELINE_BIRTHDAY)
+        self.assertEqual(birthday.value, '29.02.2000')
+        self.assertEqual(birthday.date, date(2000, 2, 29))
+
+    def test_slotted_round_trip(self) -> None:
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            record = pickle.loads(pickle.dumps(pickle.loads(BASELINE_RECORD), protocol=protocol))
+            self.assert_john(record)
+            phone = pickle.loads(pickle.dumps(Phone('1234567890'), protocol=protocol))
+            self.assertEqual(phone.value, '1234567890')
+            birthday = pickle.loads(pickle.dumps(Birthday('29.02.2000'), protocol=protocol))
+            self.assertEqual(birthday.date, date(2000, 2, 29))
+
+    def test_record_pickle_excludes_book(self) -> None:
+        book = AddressBook()
+        book.add_record(pickle.loads(BASELINE_RECORD))
+        record = pickle.loads(pickle.dumps(book['John']))
+        self.assert_john(record)
+        self.assert_john(copy.deepcopy(book['John']))
+
+    def test_userdict_book_state(self) -> None:
+        book = pickle.loads(BASELINE_PICKLE)
+        self.assertIsInstance(book, AddressBook)
+        self.assertEqual(book._by_mmdd, [(1, 1, 'John'), (2, 29, 'Jane')])
+        self.assertTrue(all(record._book is book for record in book.values()))
+        self.assertFalse(book._dirty)
+
+    def test_flat_book_round_trip(self) -> None:
+        book = pickle.loads(BASELINE_PICKLE)
+        restored = pickle.loads(pickle.dumps(book, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual({name: str(r) for name, r in restored.items()},
+                         {name: str(r) for name, r in book.items()})
+        self.assertEqual(restored._by_mmdd, book._by_mmdd)
+        self.assertTrue(all(record._book is restored for record in restored.values()))
+        self.assertFalse(restored._dirty)
+
+
+class SaveDataTest(unittest.TestCase):
+    """save_data writes atomically and leaves nothing behind on failure."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'book.pkl')
+        self.book = AddressBook()
+        self.book.add_record(Record('John'))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_failed_replace_removes_temp_file(self) -> None:
+        with mock.patch('os.replace', side_effect=OSError('cross-device link')):
+            with self.assertRaises(OSError):
+                self.book.save_data(self.filename)
+        self.assertEqual(os.listdir(self.directory.name), [])
+        self.assertTrue(self.book._dirty)
+
+    def test_keeps_mode_of_existing_file(self) -> None:
+        with open(self.filename, 'wb'):
+            pass
+        os.chmod(self.filename, 0o640)
+        self.book.save_data(self.filename)
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o640)
+        self.assertEqual(os.listdir(self.directory.name), ['book.pkl'])
+
+    def test_new_file_uses_umask_default(self) -> None:
+        umask = os.umask(0o022)
+        try:
+            self.book.save_data(self.filename)
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o644)
+
+
+if __name__ == '__main__':
+    unittest.main()